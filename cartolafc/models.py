@@ -1,47 +1,65 @@
 # -*- coding: utf-8 -*-
 
-import json
 from collections import namedtuple
 from datetime import datetime
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
-from .util import json_default
+from .util import json_default, json_dumps
 
 Posicao = namedtuple('Posicao', ['id', 'nome', 'abreviacao'])
 Status = namedtuple('Status', ['id', 'nome'])
 
-_posicoes = {
-    1: Posicao(1, 'Goleiro', 'GOL'),
-    2: Posicao(2, 'Lateral', 'LAT'),
-    3: Posicao(3, 'Zagueiro', 'ZAG'),
-    4: Posicao(4, 'Meia', 'MEI'),
-    5: Posicao(5, 'Atacante', 'ATA'),
-    6: Posicao(6, 'Técnico', 'TEC')
-}
-
-_atleta_status = {
-    2: Status(2, 'Dúvida'),
-    3: Status(3, 'Suspenso'),
-    5: Status(5, 'Contundido'),
-    6: Status(6, 'Nulo'),
-    7: Status(7, 'Provável')
-}
-
-_mercado_status = {
-    # 2: Status(2, 'Mercado aberto'),
-    # 1: Status(1, 'Mercado fechado'),
-    1: Status(1, 'Mercado aberto'),
-    2: Status(2, 'Mercado fechado'),
-    3: Status(3, 'Mercado em atualização'),
-    4: Status(4, 'Mercado em manutenção'),
-    6: Status(6, 'Final de temporada')
-}
+# Tabelas indexadas diretamente pelo id (as posições sem id correspondente ficam com None)
+_posicoes = (
+    None,
+    Posicao(1, 'Goleiro', 'GOL'),
+    Posicao(2, 'Lateral', 'LAT'),
+    Posicao(3, 'Zagueiro', 'ZAG'),
+    Posicao(4, 'Meia', 'MEI'),
+    Posicao(5, 'Atacante', 'ATA'),
+    Posicao(6, 'Técnico', 'TEC'),
+)
+
+_by_pos = itemgetter('posicao_id')
+
+_atleta_status = (
+    None,
+    None,
+    Status(2, 'Dúvida'),
+    Status(3, 'Suspenso'),
+    None,
+    Status(5, 'Contundido'),
+    Status(6, 'Nulo'),
+    Status(7, 'Provável'),
+)
+
+_mercado_status = (
+    None,
+    # Status(2, 'Mercado aberto'),
+    # Status(1, 'Mercado fechado'),
+    Status(1, 'Mercado aberto'),
+    Status(2, 'Mercado fechado'),
+    Status(3, 'Mercado em atualização'),
+    Status(4, 'Mercado em manutenção'),
+    None,
+    Status(6, 'Final de temporada'),
+)
 
 T = TypeVar('T', bound='BaseModel')
 
 
+def _fast_parse_dt(s: str) -> datetime:
+    """ Converte datas no formato 'AAAA-MM-DD HH:MM:SS' sem passar pelo strptime. """
+    if len(s) != 19:
+        return datetime.strptime(s, '%Y-%m-%d %H:%M:%S')
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
 class BaseModel(object):
+    __slots__ = ()
+
     def __repr__(self) -> str:
-        return json.dumps(self, default=json_default)
+        return json_dumps(self, default=json_default).decode('utf-8')
 
     @classmethod
     def from_dict(cls: Type[T], *args: Tuple[Any], **kwargs: Dict[str, Any]) -> T:
@@ -51,6 +69,8 @@ class BaseModel(object):
 class TimeInfo(BaseModel):
     """ Time Info """
 
+    __slots__ = ('id', 'nome', 'nome_cartola', 'slug', 'assinante', 'pontos', 'ids', 'ids_', 'foto', 'pts_rodada')
+
     def __init__(self, time_id: int, nome: str, nome_cartola: str, slug: str, assinante: bool,
                  pontos: float, ids: List[int], ids_: List[int], foto: str, pts_rodada: float) -> None:
         self.id = time_id
@@ -77,6 +97,8 @@ class TimeInfo(BaseModel):
 class Clube(BaseModel):
     """ Representa um dos 20 clubes presentes no campeonato, e possui informações como o nome e a abreviação """
 
+    __slots__ = ('id', 'nome', 'abreviacao', 'escudos')
+
     def __init__(self, clube_id: int, nome: str, abreviacao: str, escudos: Dict[str, str]) -> None:
         self.id = clube_id
         self.nome = nome
@@ -91,6 +113,9 @@ class Clube(BaseModel):
 class Atleta(BaseModel):
     """ Representa um atleta (jogador ou técnico), e possui informações como o apelido, clube e pontuação obtida """
 
+    __slots__ = ('id', 'apelido', 'foto', 'pontos', 'scout', 'posicao', 'jogos_num', 'media_num', 'entrou_em_campo',
+                 'clube', 'minimo_para_valorizar', 'status', 'is_capitao', 'nome')
+
     def __init__(self, atleta_id: int, apelido: str, foto: str, pontos: float, scout: Dict[str, int], posicao_id: int,
                  jogos_num: int, media_num: int, entrou_em_campo: bool, clube: Clube,
                  minimo_para_valorizar: Optional[float] = 0, status_id: Optional[int] = None, is_capitao: Optional[bool] = None) -> None:
@@ -116,14 +141,12 @@ class Atleta(BaseModel):
     def from_dict(cls, data: dict, clubes: Dict[int, Clube], atleta_id: Optional[int] = None,
                   minimo_para_valorizar: Optional[float] = 0.00, is_capitao: Optional[bool] = None, default=None) -> 'Atleta':
 
+        g = data.get
         atleta_id = atleta_id if atleta_id else data['atleta_id']
-        foto = data['foto'] if data['foto'] is not None else ''
-        pontos = data['pontos_num'] if 'pontos_num' in data else data['pontuacao']
-        clube = clubes.get(data['clube_id']) if data['clube_id'] != 1 else ''
-        jogos_num = data['jogos_num'] if 'jogos_num' in data else None
-        media_num = data['media_num'] if 'media_num' in data else None
-        entrou_em_campo = data['entrou_em_campo'] if 'entrou_em_campo' in data else None
-        minimo_para_valorizar = data['minimo_para_valorizar'] if 'minimo_para_valorizar' in data else 0.00
+        foto = g('foto') or ''
+        pontos = g('pontos_num', g('pontuacao'))
+        clube_id = g('clube_id')
+        clube = clubes.get(clube_id) if clube_id != 1 else ''
 
         return cls(
             atleta_id, data['apelido'],
@@ -131,12 +154,12 @@ class Atleta(BaseModel):
             pontos,
             data['scout'],
             data['posicao_id'],
-            jogos_num,
-            media_num,
-            entrou_em_campo,
+            g('jogos_num'),
+            g('media_num'),
+            g('entrou_em_campo'),
             clube,
-            minimo_para_valorizar,
-            data.get('status_id', None),
+            g('minimo_para_valorizar', 0.00),
+            g('status_id'),
             is_capitao
         )
 
@@ -144,6 +167,8 @@ class Atleta(BaseModel):
 class Clube_Atleta(BaseModel):
     """ Representa um atleta (jogador ou técnico), e possui informações como o apelido, clube e pontuação obtida """
 
+    __slots__ = ('id', 'nome', 'abreviacao')
+
     def __init__(self, id: int, nome: str, abreviacao: str) -> None:
         self.id = id
         self.nome = nome
@@ -151,8 +176,6 @@ class Clube_Atleta(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict, clubes: Dict[int, Clube]) -> 'Clube_Atleta':
-        clube = clubes.get(data['clube_id']) if data['clube_id'] != 1 else ''
-
         return cls(
             data['id'], data['nome'], data['abreviacao']
         )
@@ -161,6 +184,8 @@ class Clube_Atleta(BaseModel):
 class DestaqueRodada(BaseModel):
     """ Destaque Rodada"""
 
+    __slots__ = ('media_cartoletas', 'media_pontos', 'mito_rodada')
+
     def __init__(self, media_cartoletas: float, media_pontos: float, mito_rodada: TimeInfo) -> None:
         self.media_cartoletas = media_cartoletas
         self.media_pontos = media_pontos
@@ -175,6 +200,9 @@ class DestaqueRodada(BaseModel):
 class Destaques(BaseModel):
     """ Destaques """
 
+    __slots__ = ('posicao', 'clube_nome', 'escudo_clube', 'escalacoes', 'atleta', 'adv', 'minimo_para_valorizar',
+                 'mand')
+
     def __init__(self, posicao: str, clube_nome: str, escudo_clube: str, escalacoes: int, atleta: Dict[str, str],
                  adv: str, minimo_para_valorizar: float, mand: bool) -> None:
         self.posicao = posicao
@@ -195,6 +223,9 @@ class Destaques(BaseModel):
 class Capitaes(BaseModel):
     """ Capitaes """
 
+    __slots__ = ('posicao', 'clube_nome', 'clube_id', 'escudo_clube', 'escalacoes', 'atleta', 'adv',
+                 'minimo_para_valorizar', 'mand')
+
     def __init__(self, posicao: str, clube_nome: str, clube_id: int, escudo_clube: str, escalacoes: int,
                  atleta: Dict[str, str], adv: str, minimo_para_valorizar: float, mand: bool) -> None:
         self.posicao = posicao
@@ -216,6 +247,9 @@ class Capitaes(BaseModel):
 class Reservas(BaseModel):
     """ Reservas """
 
+    __slots__ = ('posicao', 'clube_nome', 'clube_id', 'escudo_clube', 'escalacoes', 'atleta', 'adv',
+                 'minimo_para_valorizar', 'mand')
+
     def __init__(self, posicao: str, clube_nome: str, clube_id: int, escudo_clube: str, escalacoes: int,
                  atleta: Dict[str, str], adv: str, minimo_para_valorizar: float, mand: bool) -> None:
         self.posicao = posicao
@@ -237,6 +271,8 @@ class Reservas(BaseModel):
 class Liga(BaseModel):
     """ Liga """
 
+    __slots__ = ('id', 'nome', 'slug', 'descricao', 'times', 'escudo')
+
     def __init__(self, liga_id: int, nome: str, slug: str, descricao: str, times: List[TimeInfo], escudo: str) -> None:
         self.id = liga_id
         self.nome = nome
@@ -248,7 +284,8 @@ class Liga(BaseModel):
     @classmethod
     def from_dict(cls, data: dict, ranking: Optional[str] = None) -> 'Liga':
         data_liga = data.get('liga', data)
-        times = [TimeInfo.from_dict(time, ranking=ranking) for time in data['times']] if 'times' in data else None
+        times_raw = data.get('times')
+        times = [TimeInfo.from_dict(time, ranking=ranking) for time in times_raw] if times_raw is not None else None
         return cls(data_liga['liga_id'], data_liga['nome'], data_liga['slug'], data_liga['descricao'], times,
                    data_liga['url_flamula_png'])
 
@@ -256,6 +293,8 @@ class Liga(BaseModel):
 class LigaPatrocinador(BaseModel):
     """ Liga Patrocinador """
 
+    __slots__ = ('id', 'nome', 'url_link')
+
     def __init__(self, liga_id: int, nome: str, url_link: str) -> None:
         self.id = liga_id
         self.nome = nome
@@ -269,6 +308,8 @@ class LigaPatrocinador(BaseModel):
 class Mercado(BaseModel):
     """ Mercado """
 
+    __slots__ = ('rodada_atual', 'status', 'times_escalados', 'fechamento')
+
     # def __init__(self, rodada_atual: int, status_mercado: int, times_escalados: int, aviso: str,
     #             fechamento: datetime) -> None:
     def __init__(self, rodada_atual: int, status_mercado: int, times_escalados: int, fechamento: datetime) -> None:
@@ -280,13 +321,8 @@ class Mercado(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Mercado':
-        fechamento = datetime(
-            data['fechamento']['ano'],
-            data['fechamento']['mes'],
-            data['fechamento']['dia'],
-            data['fechamento']['hora'],
-            data['fechamento']['minuto'],
-        )
+        f = data['fechamento']
+        fechamento = datetime(f['ano'], f['mes'], f['dia'], f['hora'], f['minuto'])
         # return cls(data['rodada_atual'], data['status_mercado'], data['times_escalados'], data['aviso'], fechamento)
         return cls(data['rodada_atual'], data['status_mercado'], data['times_escalados'], fechamento)
 
@@ -294,6 +330,10 @@ class Mercado(BaseModel):
 class Partida(BaseModel):
     """ Partida """
 
+    __slots__ = ('data', 'local', 'valida', 'clube_casa', 'placar_casa', 'clube_visitante', 'placar_visitante',
+                 'fim_de_jogo', 'status_transmissao_tr', 'clube_casa_escudo', 'clube_visitante_escudo',
+                 'clube_casa_posicao', 'clube_visitante_posicao')
+
     def __init__(self, data: datetime, local: str, valida: bool, clube_casa: Clube, placar_casa: int,
                  clube_visitante: Clube,
                  placar_visitante: int, fim_de_jogo: str, status_transmissao_tr: str,
@@ -314,7 +354,7 @@ class Partida(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict, clubes: Dict[int, Clube]) -> 'Partida':
-        data_ = datetime.strptime(data['partida_data'], '%Y-%m-%d %H:%M:%S')
+        data_ = _fast_parse_dt(data['partida_data'])
         local = data['local']
         valida = data['valida']
         clube_casa = clubes[data['clube_casa_id']]
@@ -323,18 +363,18 @@ class Partida(BaseModel):
         placar_visitante = data['placar_oficial_visitante']
         fim_de_jogo = data['transmissao']['label']
         status_transmissao_tr = data['status_transmissao_tr']
-        clube_casa_escudo = clubes[data['clube_casa_id']]
-        clube_visitante_escudo = clubes[data['clube_visitante_id']]
         clube_casa_posicao = data['clube_casa_posicao']
         clube_visitante_posicao = data['clube_visitante_posicao']
 
         return cls(data_, local, valida, clube_casa, placar_casa, clube_visitante, placar_visitante, fim_de_jogo,
-                   status_transmissao_tr, clube_casa_escudo, clube_visitante_escudo, clube_casa_posicao, clube_visitante_posicao)
+                   status_transmissao_tr, clube_casa, clube_visitante, clube_casa_posicao, clube_visitante_posicao)
 
 
 class PontuacaoInfo(BaseModel):
     """ Pontuação Info """
 
+    __slots__ = ('atleta_id', 'rodada_id', 'pontos', 'preco', 'variacao', 'media')
+
     def __init__(self, atleta_id: int, rodada_id: int, pontos: float, preco: float, variacao: float,
                  media: float) -> None:
         self.atleta_id = atleta_id
@@ -352,6 +392,9 @@ class PontuacaoInfo(BaseModel):
 class Time(BaseModel):
     """ Time """
 
+    __slots__ = ('patrimonio', 'valor_time', 'ultima_pontuacao', 'atletas', 'reservas', 'info', 'pontos',
+                 'rodada_atual', 'jogados')
+
     def __init__(self, patrimonio: float, valor_time: float, ultima_pontuacao: float, atletas: List[Atleta],
                  reservas: List[Atleta], info: TimeInfo, pontos: float, rodada_atual: int) -> None:
         self.patrimonio = patrimonio
@@ -366,19 +409,19 @@ class Time(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict, clubes: Dict[int, Clube], capitao: int) -> 'Time':
-        data['atletas'].sort(key=lambda a: a['posicao_id'])
-
+        # sorted em vez de sort: data pode ser um payload compartilhado pelo cache em memória
         atletas = [
             Atleta.from_dict(atleta, clubes, is_capitao=atleta['atleta_id'] == capitao)
-            for atleta in data['atletas']
+            for atleta in sorted(data['atletas'], key=_by_pos)
         ]
 
-        data['reservas'].sort(key=lambda a: a['posicao_id']) if 'reservas' in data else None
-
-        reservas = [
-            Atleta.from_dict(reserva, clubes, is_capitao=reserva['atleta_id'] == capitao)
-            for reserva in data['reservas']
-        ] if 'reservas' in data else None
+        reservas_raw = data.get('reservas')
+        reservas = None
+        if reservas_raw is not None:
+            reservas = [
+                Atleta.from_dict(reserva, clubes, is_capitao=reserva['atleta_id'] == capitao)
+                for reserva in sorted(reservas_raw, key=_by_pos)
+            ]
 
         info = TimeInfo.from_dict(data['time'])
         return cls(data['patrimonio'], data['valor_time'], data['pontos'], atletas, reservas, info,
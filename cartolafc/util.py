@@ -4,12 +4,28 @@ import datetime
 import json
 import logging
 import re
+import threading
+import time
 import unicodedata
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Union
 from bisect import bisect_left
 
 from .errors import CartolaFCError, CartolaFCOverloadError, CartolaFCGameOverError
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return json.dumps(value, default=default).encode('utf-8')
+
 
 def _strip_accents(text: str) -> str:
     text = unicodedata.normalize('NFD', text)
@@ -39,12 +55,20 @@ def json_default(value: Any) -> dict:
             microsecond=value.microsecond,
             tzinfo=value.tzinfo
         )
+    if isinstance(value, tuple):
+        return list(value)
+    if hasattr(value, '__slots__'):
+        return {
+            name: getattr(value, name)
+            for cls in reversed(type(value).__mro__) for name in getattr(cls, '__slots__', ())
+            if hasattr(value, name)
+        }
     return value.__dict__
 
 
-def parse_and_check_cartolafc(json_data: str) -> dict:
+def parse_and_check_cartolafc(json_data: Union[bytes, str]) -> dict:
     try:
-        data = json.loads(json_data)
+        data = json_loads(json_data)
         # if 'game_over' in data and data['game_over']:
         #     logging.info('Desculpe-nos, o jogo acabou e não podemos obter os dados solicitados')
         #     raise CartolaFCGameOverError('Desculpe-nos, o jogo acabou e não podemos obter os dados solicitados')
@@ -53,8 +77,36 @@ def parse_and_check_cartolafc(json_data: str) -> dict:
             raise CartolaFCError(data['mensagem'].encode('utf-8'))
         return data
     except ValueError as error:
+        if isinstance(json_data, bytes):
+            json_data = json_data.decode('utf-8', 'replace')
         logging.error('Error parsing and checking json data: %s', json_data)
         logging.error(error)
         raise CartolaFCOverloadError('Globo.com - Desculpe-nos, nossos servidores estão sobrecarregados.')
 
 
+class TTLCache(object):
+    """ Cache em memória com quantidade máxima de itens, onde cada item expira após ttl segundos """
+
+    def __init__(self, maxsize: int = 512, ttl: int = 10) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)